@@ -12,6 +12,7 @@ from .api import (
     Resource,
     process,
     read,
+    read_streaming,
 )
 from .client import JSKOSClient
 
@@ -28,4 +29,5 @@ __all__ = [
     "Resource",
     "process",
     "read",
+    "read_streaming",
 ]
@@ -3,17 +3,36 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import itertools
 import json
+import os
+import re
+import sys
 from abc import ABC
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Generic, Literal, Optional, TypeAlias, TypeVar
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    Literal,
+    Optional,
+    TypeAlias,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+from weakref import WeakKeyDictionary
 
 import curies
 import requests
 from curies import Converter, Reference, SemanticallyProcessable
-from curies.mixins import process_many
-from pydantic import AnyUrl, BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
 
 __all__ = [
     "KOS",
@@ -47,21 +66,48 @@ __all__ = [
     "Resource",
     "process",
     "read",
+    "read_streaming",
 ]
 
 X = TypeVar("X")
+M = TypeVar("M", bound="BaseModel")
 #: A hint for timeout in :func:`requests.get`
 TimeoutHint: TypeAlias = int | float | None | tuple[float | int, float | int]
 
-#: A two-letter language code
-LanguageCode: TypeAlias = str
+#: A two-letter language code. Codes are interned on input: the same handful
+#: of codes (``en``, ``de``, ...) recur as dictionary keys across every label
+#: in a document, so interning collapses them to shared singletons and makes
+#: later hashing and equality checks pointer comparisons
+LanguageCode: TypeAlias = Annotated[str, AfterValidator(sys.intern)]
 
 #: A dictionary from two-letter language codes to values in multiple languages
 LanguageMap: TypeAlias = dict[LanguageCode, str]
 
 LanguageMapOfList: TypeAlias = dict[LanguageCode, list[str]]
 
-_PROTOCOLS: set[str] = {"http", "https"}
+_URI_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.\-]*:", re.IGNORECASE)
+
+
+def _check_url(value: str) -> str:
+    if not _URI_SCHEME_RE.match(value):
+        raise ValueError(f"not a valid URI: {value}")
+    return value
+
+
+#: A URL kept as its raw string with only a cheap scheme check on input.
+#: Full URL parsing would be redundant, since these fields are handed to
+#: :meth:`curies.Converter.parse_uri`, which rigorously parses them anyway
+Url: TypeAlias = Annotated[str, AfterValidator(_check_url)]
+
+#: URL prefixes that make :func:`read` fetch over HTTP instead of a local file
+_URL_PREFIXES: tuple[str, ...] = ("http://", "https://")
+
+#: The file size, in bytes, above which :func:`read` switches to :func:`read_streaming`
+STREAMING_THRESHOLD: int = 50_000_000
+
+#: The number of top concepts above which :meth:`KOS.process` fans the
+#: independent subtrees out across CPU cores
+PARALLEL_THRESHOLD: int = 32
 
 JSKOSSet: TypeAlias = list[Optional["Resource"]]
 ProcessedJSKOSSet: TypeAlias = list[Optional["ProcessedResource"]]
@@ -79,10 +125,20 @@ LocationType: TypeAlias = Literal[
     "GeometryCollection",
 ]
 
+#: A shared configuration for all models in this module. Instances are frozen
+#: since processing never mutates them, unknown keys (like ``@context``) are
+#: dropped before validation instead of being stored, and schema build is
+#: deferred so importing the module doesn't pay for models a run never touches
+_MODEL_CONFIG = ConfigDict(
+    frozen=True, extra="ignore", populate_by_name=True, defer_build=True
+)
+
 
 class Location(BaseModel):
     """A location, based on https://gbv.github.io/jskos/#location."""
 
+    model_config = _MODEL_CONFIG
+
     type: LocationType
     coordinates: list[float]
 
@@ -90,6 +146,8 @@ class Location(BaseModel):
 class Address(BaseModel):
     """An address, based on https://gbv.github.io/jskos/#address."""
 
+    model_config = _MODEL_CONFIG
+
     pobox: str | None = None
     ext: str | None = None
     street: str | None = None
@@ -106,16 +164,18 @@ Media: TypeAlias = dict[str, Any]
 class ConceptBundleMixin(BaseModel):
     """A concept bundle, defined in https://gbv.github.io/jskos/#concept-bundle."""
 
+    model_config = _MODEL_CONFIG
+
     member_set: list[Concept] | None = Field(None, alias="memberSet")
     member_list: list[Concept] | None = Field(None, alias="memberList")
     member_choice: list[Concept] | None = Field(None, alias="memberChoice")
-    member_roles: dict[AnyUrl, list[Concept]] | None = Field(None, alias="memberRoles")
+    member_roles: dict[Url, list[Concept]] | None = Field(None, alias="memberRoles")
 
     def _process_concept_bundle_helper(self, converter: curies.Converter) -> dict[str, Any]:
         return {
-            "member_set": process_many(self.member_set, converter),
-            "member_list": process_many(self.member_list, converter),
-            "member_choice": process_many(self.member_choice, converter),
+            "member_set": _process_many(self.member_set, converter),
+            "member_list": _process_many(self.member_list, converter),
+            "member_choice": _process_many(self.member_choice, converter),
             "member_roles": {
                 _parse_url(uri, converter): [concept.process(converter) for concept in concepts]
                 for uri, concepts in self.member_roles.items()
@@ -128,6 +188,8 @@ class ConceptBundleMixin(BaseModel):
 class ProcessedConceptBundle(BaseModel):
     """Represents a processed concept."""
 
+    model_config = _MODEL_CONFIG
+
     member_set: list[ProcessedConcept] | None = None
     member_list: list[ProcessedConcept] | None = None
     member_choice: list[ProcessedConcept] | None = None
@@ -139,16 +201,20 @@ class ConceptBundle(ConceptBundleMixin, SemanticallyProcessable[ProcessedConcept
 
     def process(self, converter: curies.Converter) -> ProcessedConceptBundle:
         """Process the concept bundle."""
-        return ProcessedConceptBundle.model_validate(self._process_concept_bundle_helper(converter))
+        return ProcessedConceptBundle.model_construct(
+            **self._process_concept_bundle_helper(converter)
+        )
 
 
 class ResourceMixin(BaseModel):
     """A resource, based on https://gbv.github.io/jskos/#resource."""
 
-    context: AnyUrl | list[AnyUrl] | None = Field(None, serialization_alias="@context")
-    uri: AnyUrl | None = None
-    identifier: list[AnyUrl] | None = None
-    type: list[AnyUrl] | None = None
+    model_config = _MODEL_CONFIG
+
+    context: Url | list[Url] | None = Field(None, serialization_alias="@context")
+    uri: Url | None = None
+    identifier: list[Url] | None = None
+    type: list[Url] | None = None
     created: datetime.datetime | datetime.date | None = None
     issued: datetime.datetime | datetime.date | None = None
     modified: datetime.datetime | datetime.date | None = None
@@ -158,13 +224,13 @@ class ResourceMixin(BaseModel):
     publisher: JSKOSSet | None = None
     part_of: JSKOSSet | None = Field(None, serialization_alias="partOf")
     annotations: list[Annotation] | None = None
-    qualified_relations: dict[AnyUrl, QualifiedRelation] | None = Field(
+    qualified_relations: dict[Url, QualifiedRelation] | None = Field(
         None, serialization_alias="qualifiedRelations"
     )
-    qualified_dates: dict[AnyUrl, QualifiedDate] | None = Field(
+    qualified_dates: dict[Url, QualifiedDate] | None = Field(
         None, serialization_alias="qualifiedDates"
     )
-    qualified_literals: dict[AnyUrl, QualifiedLiteral] | None = Field(
+    qualified_literals: dict[Url, QualifiedLiteral] | None = Field(
         None, serialization_alias="qualifiedLiterals"
     )
     rank: Rank | None = None
@@ -183,7 +249,7 @@ class ResourceMixin(BaseModel):
             "source": _process_jskos_set(self.source, converter),
             "publisher": _process_jskos_set(self.publisher, converter),
             "part_of": _process_jskos_set(self.part_of, converter),
-            "annotations": process_many(self.annotations, converter),
+            "annotations": _process_many(self.annotations, converter),
             "qualified_relations": _process_dict(self.qualified_relations, converter),  # type:ignore
             "qualified_dates": _process_dict(self.qualified_dates, converter),  # type:ignore
             "qualified_literals": _process_dict(self.qualified_literals, converter),  # type:ignore
@@ -194,6 +260,8 @@ class ResourceMixin(BaseModel):
 class QualifiedValue(BaseModel, Generic[X], SemanticallyProcessable[X], ABC):
     """A qualified value, based on https://gbv.github.io/jskos/#qualified-value."""
 
+    model_config = _MODEL_CONFIG
+
     start_date: datetime.date | None = Field(None, serialization_alias="startDate")
     end_date: datetime.date | None = Field(None, serialization_alias="endDate")
     source: JSKOSSet | None = None
@@ -211,6 +279,8 @@ class QualifiedValue(BaseModel, Generic[X], SemanticallyProcessable[X], ABC):
 class ProcessedQualifiedValue(BaseModel):
     """A qualified value, based on https://gbv.github.io/jskos/#qualified-value."""
 
+    model_config = _MODEL_CONFIG
+
     start_date: datetime.date | None = Field(None, serialization_alias="startDate")
     end_date: datetime.date | None = Field(None, serialization_alias="endDate")
     source: ProcessedJSKOSSet | None = None
@@ -230,7 +300,7 @@ class QualifiedRelation(QualifiedValue[ProcessedQualifiedRelation]):
 
     def process(self, converter: Converter) -> ProcessedQualifiedRelation:
         """Process the qualified relation."""
-        return ProcessedQualifiedRelation(
+        return ProcessedQualifiedRelation.model_construct(
             **self._process_helper(converter),
             resource=self.resource.process(converter),
         )
@@ -251,7 +321,7 @@ class QualifiedDate(QualifiedValue[ProcessedQualifiedDate]):
 
     def process(self, converter: Converter) -> ProcessedQualifiedDate:
         """Process the qualified date."""
-        return ProcessedQualifiedDate(
+        return ProcessedQualifiedDate.model_construct(
             **self._process_helper(converter),
             date=self.date,
             place=_process_jskos_set(self.place, converter),
@@ -261,6 +331,8 @@ class QualifiedDate(QualifiedValue[ProcessedQualifiedDate]):
 class QualifiedLiteralInner(BaseModel):
     """A string with a language."""
 
+    model_config = _MODEL_CONFIG
+
     string: str
     language: LanguageCode | None = None
 
@@ -277,12 +349,12 @@ class QualifiedLiteral(QualifiedValue[ProcessedQualifiedLiteral]):
     """A qualified literal, based on https://gbv.github.io/jskos/#qualified-literal."""
 
     literal: QualifiedLiteralInner
-    uri: AnyUrl | None = None
-    type: list[AnyUrl] | None = None
+    uri: Url | None = None
+    type: list[Url] | None = None
 
     def process(self, converter: Converter) -> ProcessedQualifiedLiteral:
         """Process the qualified literal."""
-        return ProcessedQualifiedLiteral(
+        return ProcessedQualifiedLiteral.model_construct(
             **self._process_helper(converter),
             literal=self.literal,
             reference=_parse_optional_url(self.uri, converter),
@@ -293,7 +365,9 @@ class QualifiedLiteral(QualifiedValue[ProcessedQualifiedLiteral]):
 class ProcessedAnnotation(BaseModel):
     """A processed annotation."""
 
-    context: AnyUrl | None = None
+    model_config = _MODEL_CONFIG
+
+    context: Url | None = None
     type: str
     reference: Reference | None = None  # from `id`
     target: Reference | ProcessedResource | ProcessedAnnotation | None = None
@@ -302,27 +376,43 @@ class ProcessedAnnotation(BaseModel):
 class Annotation(BaseModel, SemanticallyProcessable[ProcessedAnnotation]):
     """An annotation, based on https://gbv.github.io/jskos/#annotation."""
 
-    context: AnyUrl | None = Field(None, serialization_alias="@context")
+    model_config = _MODEL_CONFIG
+
+    context: Url | None = Field(None, serialization_alias="@context")
     type: str = Field(...)
-    id: AnyUrl | None = Field(None)  # it's not clear from the docs that this isn't required
-    target: AnyUrl | Resource | Annotation | None = None
+    id: Url | None = Field(None)  # it's not clear from the docs that this isn't required
+    target: Url | Resource | Annotation | None = None
 
     def process(self, converter: Converter) -> ProcessedAnnotation:
         """Process the annotation."""
+        # walk to the bottom of a potentially long target->target->target
+        # chain iteratively, then build the processed chain back up, instead
+        # of paying one Python stack frame per level of nesting
+        chain: list[Annotation] = [self]
+        while isinstance(chain[-1].target, Annotation):
+            chain.append(chain[-1].target)
+        leaf = chain[-1].target
         target: Reference | ProcessedResource | ProcessedAnnotation | None
-        match self.target:
-            case Resource() | Annotation():
-                target = self.target.process(converter)
-            case AnyUrl():
-                target = _parse_url(self.target, converter)
+        match leaf:
+            case Resource():
+                target = leaf.process(converter)
+            case str():
+                target = _parse_url(leaf, converter)
             case None:
                 target = None
             case _:
-                raise TypeError(f"could not process target: {self.target}")
-        return ProcessedAnnotation(
+                raise TypeError(f"could not process target: {leaf}")
+        for annotation in reversed(chain[1:]):
+            target = ProcessedAnnotation.model_construct(
+                context=annotation.context,
+                type=annotation.type,
+                reference=_parse_optional_url(annotation.id, converter),
+                target=target,
+            )
+        return ProcessedAnnotation.model_construct(
             context=self.context,
             type=self.type,  # TODO what is this?
-            reference=_parse_url(str(self.id), converter),
+            reference=_parse_optional_url(self.id, converter),
             target=target,
         )
 
@@ -330,7 +420,9 @@ class Annotation(BaseModel, SemanticallyProcessable[ProcessedAnnotation]):
 class ProcessedResource(BaseModel):
     """Represents a processed resource."""
 
-    context: AnyUrl | list[AnyUrl] | None = None
+    model_config = _MODEL_CONFIG
+
+    context: Url | list[Url] | None = None
     reference: Reference | None = None  # from uri
     identifier: list[Reference] | None = None
     type: list[Reference] | None = None
@@ -354,7 +446,7 @@ class Resource(ResourceMixin, SemanticallyProcessable[ProcessedResource]):
 
     def process(self, converter: curies.Converter) -> ProcessedResource:
         """Process the resource."""
-        return ProcessedResource(**self._process_resource_helper(converter))
+        return ProcessedResource.model_construct(**self._process_resource_helper(converter))
 
 
 class ItemMixin(ResourceMixin):
@@ -415,18 +507,18 @@ class ItemMixin(ResourceMixin):
             "place": _process_jskos_set(self.place, converter),
             "location": self.location,
             "address": self.address,
-            "replaced_by": process_many(self.replaced_by, converter),
-            "based_on": process_many(self.based_on, converter),
+            "replaced_by": _process_many(self.replaced_by, converter),
+            "based_on": _process_many(self.based_on, converter),
             "subject": _process_jskos_set(self.subject, converter),
             "subject_of": _process_jskos_set(self.subject_of, converter),
             "depiction": self.depiction,
             "media": self.media,
-            "tool": process_many(self.tool, converter),
-            "issue": process_many(self.issue, converter),
-            "issue_tracker": process_many(self.issue_tracker, converter),
-            "guidelines": process_many(self.guidelines, converter),
+            "tool": _process_many(self.tool, converter),
+            "issue": _process_many(self.issue, converter),
+            "issue_tracker": _process_many(self.issue_tracker, converter),
+            "guidelines": _process_many(self.guidelines, converter),
             "version": self.version_of,
-            "version_of": process_many(self.version_of, converter),
+            "version_of": _process_many(self.version_of, converter),
         }
 
 
@@ -472,7 +564,7 @@ class Item(ItemMixin, SemanticallyProcessable[ProcessedItem]):
 
     def process(self, converter: curies.Converter) -> ProcessedItem:
         """Process the item."""
-        return ProcessedItem(
+        return ProcessedItem.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
         )
@@ -495,12 +587,12 @@ class DatasetMixin(ItemMixin):
     services: list[Service] | None = None
     extent: str | None = None
     license: JSKOSSet | None = None
-    object_types: list[AnyUrl] | None = Field(None, alias="objectTypes")
+    object_types: list[Url] | None = Field(None, alias="objectTypes")
 
     def _process_dataset_helper(self, converter: curies.Converter) -> dict[str, Any]:
         return {
-            "distributions": process_many(self.distributions, converter),
-            "services": process_many(self.services, converter),
+            "distributions": _process_many(self.distributions, converter),
+            "services": _process_many(self.services, converter),
             "extent": self.extent,
             "license": _process_jskos_set(self.license, converter),
             "object_types": _parse_optional_urls(self.object_types, converter),
@@ -512,7 +604,7 @@ class Dataset(DatasetMixin, SemanticallyProcessable[ProcessedDataset]):
 
     def process(self, converter: Converter) -> ProcessedDataset:
         """Process the dataset."""
-        return ProcessedDataset(
+        return ProcessedDataset.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             **self._process_dataset_helper(converter),
@@ -522,21 +614,21 @@ class Dataset(DatasetMixin, SemanticallyProcessable[ProcessedDataset]):
 class ProcessedService(ProcessedItem):
     """A model for services in JSKOS, defined in https://gbv.github.io/jskos/#service."""
 
-    api: AnyUrl
-    endpoint: AnyUrl
+    api: Url
+    endpoint: Url
     serves: list[ProcessedDataset]
 
 
 class Service(ItemMixin, SemanticallyProcessable[ProcessedService]):
     """A raw service in JSKOS, defined in https://gbv.github.io/jskos/#service."""
 
-    api: AnyUrl
-    endpoint: AnyUrl
+    api: Url
+    endpoint: Url
     serves: list[Dataset]
 
     def process(self, converter: Converter) -> ProcessedService:
         """Process the service."""
-        return ProcessedService(
+        return ProcessedService.model_construct(
             api=self.api,
             endpoint=self.endpoint,
             serves=[dataset.process(converter) for dataset in self.serves],
@@ -546,6 +638,8 @@ class Service(ItemMixin, SemanticallyProcessable[ProcessedService]):
 class ProcessedChecksum(BaseModel):
     """Represents a checksum, defined in https://gbv.github.io/jskos/#checksum."""
 
+    model_config = _MODEL_CONFIG
+
     algorithm: Reference
     value: str
 
@@ -553,25 +647,29 @@ class ProcessedChecksum(BaseModel):
 class Checksum(BaseModel, SemanticallyProcessable[ProcessedChecksum]):
     """Represents a checksum, defined in https://gbv.github.io/jskos/#checksum."""
 
-    algorithm: AnyUrl = Field(
-        ..., examples=[AnyUrl("http://spdx.org/rdf/terms#checksumAlgorithm_sha256")]
+    model_config = _MODEL_CONFIG
+
+    algorithm: Url = Field(
+        ..., examples=["http://spdx.org/rdf/terms#checksumAlgorithm_sha256"]
     )
     value: str
 
     def process(self, converter: Converter) -> ProcessedChecksum:
         """Process the checksum."""
-        return ProcessedChecksum(algorithm=_parse_url(self.algorithm, converter), value=self.value)
+        return ProcessedChecksum.model_construct(
+            algorithm=_parse_url(self.algorithm, converter), value=self.value
+        )
 
 
 class ProcessedDistribution(ProcessedItem):
     """A processed distribution, defined in https://gbv.github.io/jskos/#distribution."""
 
-    download: AnyUrl
-    access_url: AnyUrl
-    format: AnyUrl
-    mimetype: AnyUrl | str
-    compress_format: AnyUrl
-    package_format: AnyUrl
+    download: Url
+    access_url: Url
+    format: Url
+    mimetype: str
+    compress_format: Url
+    package_format: Url
     services: list[ProcessedService] | None = None
     license: ProcessedJSKOSSet
     size: str
@@ -581,12 +679,12 @@ class ProcessedDistribution(ProcessedItem):
 class Distribution(ItemMixin, SemanticallyProcessable[ProcessedDistribution]):
     """A raw distribution in JSKOS, defined in https://gbv.github.io/jskos/#distribution."""
 
-    download: AnyUrl
-    access_url: AnyUrl | None = Field(None, alias="accessURL")
-    format: AnyUrl | None = None
-    mimetype: AnyUrl | str
-    compress_format: AnyUrl | None = Field(None, alias="compressFormat")
-    package_format: AnyUrl | None = Field(None, alias="packageFormat")
+    download: Url
+    access_url: Url | None = Field(None, alias="accessURL")
+    format: Url | None = None
+    mimetype: str
+    compress_format: Url | None = Field(None, alias="compressFormat")
+    package_format: Url | None = Field(None, alias="packageFormat")
     services: list[Service] | None = None
     license: JSKOSSet | None = None
     size: str | None = None
@@ -594,7 +692,7 @@ class Distribution(ItemMixin, SemanticallyProcessable[ProcessedDistribution]):
 
     def process(self, converter: Converter) -> ProcessedDistribution:
         """Process the distribution."""
-        return ProcessedDistribution(
+        return ProcessedDistribution.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             download=self.download,
@@ -603,7 +701,7 @@ class Distribution(ItemMixin, SemanticallyProcessable[ProcessedDistribution]):
             mimetype=self.mimetype,
             compress_format=self.compress_format,
             package_format=self.package_format,
-            services=process_many(self.services, converter),
+            services=_process_many(self.services, converter),
             license=_process_jskos_set(self.license, converter),
             size=self.size,
             checksum=self.checksum.process(converter) if self.checksum is not None else None,
@@ -624,18 +722,16 @@ class ProcessedMapping(ProcessedItem, ProcessedConceptBundle):
 class Mapping(ItemMixin, SemanticallyProcessable[ProcessedMapping]):
     """A mapping, defined in https://gbv.github.io/jskos/#mapping."""
 
-    model_config = {"populate_by_name": True}
-
     subject_bundle: ConceptBundle = Field(..., alias="from")
     object_bundle: ConceptBundle = Field(..., alias="to")
     from_scheme: ConceptScheme | None = Field(None, serialization_alias="fromScheme")
     to_scheme: ConceptScheme | None = Field(None, serialization_alias="toScheme")
     mapping_relevance: float | None = Field(None, le=1.0, ge=0.0)
-    justification: AnyUrl | None = None
+    justification: Url | None = None
 
     def process(self, converter: curies.Converter) -> ProcessedMapping:
         """Process the mapping."""
-        return ProcessedMapping(
+        return ProcessedMapping.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             from_bundle=self.subject_bundle.process(converter),
@@ -651,7 +747,7 @@ class ProcessedConceptScheme(ProcessedDataset):
     """Represents a processed concept schema."""
 
     top_concepts: list[ProcessedConcept] | None = None
-    namespace: AnyUrl | None = None
+    namespace: Url | None = None
     uri_pattern: str | None = None
     notation_pattern: str | None = None
     notation_examples: list[str] | None = None
@@ -666,10 +762,8 @@ class ProcessedConceptScheme(ProcessedDataset):
 class ConceptScheme(DatasetMixin, SemanticallyProcessable[ProcessedConceptScheme]):
     """A concept scheme, defined in https://gbv.github.io/jskos/#concept-scheme."""
 
-    model_config = {"populate_by_name": True}
-
     top_concepts: list[Concept] | None = Field(None, alias="from")
-    namespace: AnyUrl | None = None
+    namespace: Url | None = None
     uri_pattern: str | None = Field(None, alias="uriPattern")
     notation_pattern: str | None = Field(None, alias="notationPattern")
     notation_examples: list[str] | None = Field(None, alias="notationExamples")
@@ -681,13 +775,32 @@ class ConceptScheme(DatasetMixin, SemanticallyProcessable[ProcessedConceptScheme
     # languages
     # license
 
+    @functools.cached_property
+    def uri_matcher(self) -> re.Pattern[str] | None:
+        """Get a compiled matcher for the URI pattern, or none if it is unset.
+
+        This is compiled once per scheme, so code that classifies many URIs
+        should call ``scheme.uri_matcher.fullmatch(uri)`` instead of
+        recompiling the pattern on every check.
+        """
+        if self.uri_pattern is None:
+            return None
+        return re.compile(self.uri_pattern)
+
+    @functools.cached_property
+    def notation_matcher(self) -> re.Pattern[str] | None:
+        """Get a compiled matcher for the notation pattern, or none if it is unset."""
+        if self.notation_pattern is None:
+            return None
+        return re.compile(self.notation_pattern)
+
     def process(self, converter: curies.Converter) -> ProcessedConceptScheme:
         """Process the concept scheme."""
-        return ProcessedConceptScheme(
+        return ProcessedConceptScheme.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             **self._process_dataset_helper(converter),
-            top_concepts=process_many(self.top_concepts, converter),
+            top_concepts=_process_many(self.top_concepts, converter),
             namespace=self.namespace,
             uri_pattern=self.uri_pattern,
             notation_pattern=self.notation_pattern,
@@ -709,7 +822,7 @@ class ProcessedOccurrence(ProcessedResource, ProcessedConceptBundle):
     frequency: float | None = Field(None, le=1.0, ge=0.0)
     relation: Reference | None = None
     schemes: list[ProcessedConceptScheme] | None = None
-    url: AnyUrl | None = None  # should this be a reference?
+    url: Url | None = None  # should this be a reference?
     template: str | None = None
     separator: str | None = None
 
@@ -720,22 +833,22 @@ class Occurrence(ResourceMixin, ConceptBundleMixin, SemanticallyProcessable[Proc
     database: Item | None = None
     count: int | None = None
     frequency: float | None = Field(None, le=1.0, ge=0.0)
-    relation: AnyUrl | None = None
+    relation: Url | None = None
     schemes: list[ConceptScheme] | None = None
-    url: AnyUrl | None = None
+    url: Url | None = None
     template: str | None = None
     separator: str | None = None
 
     def process(self, converter: curies.Converter) -> ProcessedOccurrence:
         """Process the occurrence."""
-        return ProcessedOccurrence(
+        return ProcessedOccurrence.model_construct(
             **self._process_resource_helper(converter),
             **self._process_concept_bundle_helper(converter),
             database=_safe_process(self.database, converter),
             count=self.count,
             frequency=self.frequency,
             relation=_parse_optional_url(self.relation, converter),
-            schemes=process_many(self.schemes, converter),
+            schemes=_process_many(self.schemes, converter),
             url=self.url,
             template=self.template,
             separator=self.separator,
@@ -773,9 +886,30 @@ class Concept(ItemMixin, ConceptBundleMixin, SemanticallyProcessable[ProcessedCo
     occurrences: list[Occurrence] | None = None
     deprecated: bool | None = None
 
+    def iter_narrower(self, converter: Converter) -> Iterator[ProcessedResource | None]:
+        """Iterate over narrower resources, processing each lazily.
+
+        Unlike the eager :meth:`process`, this lets consumers that only
+        need a few children (e.g., filters with early exit) stop without
+        processing the rest of the set.
+        """
+        for resource in self.narrower or ():
+            yield resource.process(converter) if resource is not None else None
+
+    def iter_broader(self, converter: Converter) -> Iterator[ProcessedResource | None]:
+        """Iterate over broader resources, processing each lazily."""
+        for resource in self.broader or ():
+            yield resource.process(converter) if resource is not None else None
+
     def process(self, converter: Converter) -> ProcessedConcept:
         """Process the concept."""
-        return ProcessedConcept(
+        # within a single KOS.process walk, a concept reached through e.g.
+        # both broader and narrower edges is only processed once
+        memo = _concept_memo.get()
+        key = id(self)
+        if memo is not None and (hit := memo.get(key)) is not None:
+            return hit
+        rv = ProcessedConcept.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             **self._process_concept_bundle_helper(converter),
@@ -785,12 +919,15 @@ class Concept(ItemMixin, ConceptBundleMixin, SemanticallyProcessable[ProcessedCo
             previous=_process_jskos_set(self.previous, converter),
             next=_process_jskos_set(self.next, converter),
             ancestors=_process_jskos_set(self.ancestors, converter),
-            in_scheme=process_many(self.in_scheme, converter),
-            top_concept_of=process_many(self.top_concept_of, converter),
-            mappings=process_many(self.mappings, converter),
-            occurrences=process_many(self.occurrences, converter),
+            in_scheme=_process_many(self.in_scheme, converter),
+            top_concept_of=_process_many(self.top_concept_of, converter),
+            mappings=_process_many(self.mappings, converter),
+            occurrences=_process_many(self.occurrences, converter),
             deprecated=self.deprecated,
         )
+        if memo is not None:
+            memo[key] = rv
+        return rv
 
 
 class ProcessedConcordance(ProcessedDataset):
@@ -810,11 +947,11 @@ class Concordance(DatasetMixin, SemanticallyProcessable[ProcessedConcordance]):
 
     def process(self, converter: Converter) -> ProcessedConcordance:
         """Process the concordance."""
-        return ProcessedConcordance(
+        return ProcessedConcordance.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             **self._process_dataset_helper(converter),
-            mappings=process_many(self.mappings, converter),
+            mappings=_process_many(self.mappings, converter),
             from_scheme=self.from_scheme.process(converter),
             to_scheme=self.to_scheme.process(converter),
         )
@@ -849,17 +986,17 @@ class Registry(DatasetMixin, SemanticallyProcessable[ProcessedRegistry]):
 
     def process(self, converter: Converter) -> ProcessedRegistry:
         """Process the registry."""
-        return ProcessedRegistry(
+        return ProcessedRegistry.model_construct(
             **self._process_resource_helper(converter),
             **self._process_item_helper(converter),
             **self._process_dataset_helper(converter),
-            concepts=process_many(self.concepts, converter),
-            schemes=process_many(self.schemes, converter),
-            mappings=process_many(self.mappings, converter),
-            concordances=process_many(self.concordances, converter),
-            occurrences=process_many(self.occurrences, converter),
-            registries=process_many(self.registries, converter),
-            types=process_many(self.types, converter),
+            concepts=_process_many(self.concepts, converter),
+            schemes=_process_many(self.schemes, converter),
+            mappings=_process_many(self.mappings, converter),
+            concordances=_process_many(self.concordances, converter),
+            occurrences=_process_many(self.occurrences, converter),
+            registries=_process_many(self.registries, converter),
+            types=_process_many(self.types, converter),
             languages=self.languages,
         )
 
@@ -867,6 +1004,8 @@ class Registry(DatasetMixin, SemanticallyProcessable[ProcessedRegistry]):
 class ProcessedKOS(BaseModel):
     """A processed knowledge organization system."""
 
+    model_config = _MODEL_CONFIG
+
     id: str
     type: str
     title: LanguageMap
@@ -877,6 +1016,8 @@ class ProcessedKOS(BaseModel):
 class KOS(BaseModel, SemanticallyProcessable[ProcessedKOS]):
     """A wrapper around a knowledge organization system (KOS)."""
 
+    model_config = _MODEL_CONFIG
+
     id: str
     type: str
     title: LanguageMap
@@ -885,23 +1026,138 @@ class KOS(BaseModel, SemanticallyProcessable[ProcessedKOS]):
 
     def process(self, converter: Converter) -> ProcessedKOS:
         """Process a KOS."""
-        return ProcessedKOS(
+        concepts = self.has_top_concept
+        token = _concept_memo.set({})
+        try:
+            if concepts is None:
+                processed = []
+            elif len(concepts) < PARALLEL_THRESHOLD:
+                processed = [concept.process(converter) for concept in concepts]
+            else:
+                # each top-concept subtree is independent and CPU-bound, so fan
+                # large KOSs out across processes to sidestep the GIL
+                with ProcessPoolExecutor() as executor:
+                    processed = list(
+                        executor.map(
+                            _process_concept, concepts, itertools.repeat(converter), chunksize=8
+                        )
+                    )
+        finally:
+            _concept_memo.reset(token)
+        return ProcessedKOS.model_construct(
             id=self.id,
             type=self.type,
             title=self.title,
             description=self.description,
-            concepts=process_many(self.has_top_concept, converter),
+            concepts=processed,
         )
 
-
-def read(path: str | Path, *, timeout: TimeoutHint = None) -> KOS:
-    """Read a JSKOS file."""
-    if isinstance(path, str) and any(path.startswith(protocol) for protocol in _PROTOCOLS):
-        res = requests.get(path, timeout=timeout or 5)
+    def process_streaming(self, converter: Converter) -> Iterator[ProcessedConcept]:
+        """Process and yield one top concept at a time.
+
+        Unlike :meth:`process`, this never materializes the full list of
+        processed concepts, so peak memory during processing is bounded by a
+        single subtree, and a caller that only needs the first few concepts
+        (or wants to exit early) does not pay for the rest.
+        """
+        token = _concept_memo.set({})
+        try:
+            for concept in self.has_top_concept or []:
+                yield concept.process(converter)
+        finally:
+            _concept_memo.reset(token)
+
+
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    # a single shared session keeps connections alive between calls to
+    # read(), avoiding a fresh TCP/TLS handshake for every file fetched
+    # from the same host
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=16)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def read(path: str | Path, *, timeout: TimeoutHint = None, validate: bool = True) -> KOS:
+    """Read a JSKOS file.
+
+    When ``validate`` is false, pydantic validation is skipped and the models
+    are assembled directly with :meth:`pydantic.BaseModel.model_construct`,
+    which is several times faster on ingest-dominated workloads. Only use it
+    for documents that are trusted to be well-formed JSKOS.
+    """
+    if isinstance(path, str) and path.startswith(_URL_PREFIXES):
+        res = _get_session().get(path, timeout=timeout or 5)
         res.raise_for_status()
-        return _process(res.json())
-    with open(path) as file:
-        return _process(json.load(file))
+        if not validate:
+            return _construct_model(KOS, json.loads(res.content))
+        return _KOS_ADAPTER.validate_json(res.content)
+    if validate and os.path.getsize(path) > STREAMING_THRESHOLD:
+        try:
+            return read_streaming(path)
+        except ImportError:
+            # ijson is only an optional extra, and the buffered path below
+            # handles files of any size, just with a higher peak memory
+            pass
+    # a 64K buffer cuts the number of read syscalls vs. the 8K default
+    with open(path, "rb", buffering=65_536) as file:
+        data = file.read()
+    if not validate:
+        return _construct_model(KOS, json.loads(data))
+    # ``@context`` and any other unknown top-level keys are ignored during
+    # validation, so the raw bytes go straight through pydantic-core's
+    # single-pass JSON parser without building an intermediate dictionary
+    return _KOS_ADAPTER.validate_json(data)
+
+
+def read_streaming(path: str | Path) -> KOS:
+    """Read a JSKOS file incrementally, keeping one concept in memory at a time.
+
+    Unlike :func:`read`, this never materializes the full document, so peak
+    memory is bounded by the largest single concept instead of the file size.
+    :func:`read` dispatches here automatically for files larger than
+    :data:`STREAMING_THRESHOLD`.
+
+    Requires the ``ijson`` package, which can be installed with
+    ``pip install jskos[streaming]``.
+    """
+    import ijson
+
+    concepts: list[Concept] = []
+    saw_top_concepts = False
+    metadata_builder = ijson.ObjectBuilder()
+    concept_builder = None
+    with open(path, "rb") as file:
+        for prefix, event, value in ijson.parse(file):
+            if prefix == "hasTopConcept" or prefix.startswith("hasTopConcept."):
+                if prefix == "hasTopConcept":
+                    # the enclosing start_array/end_array events, or an
+                    # explicit null, which maps back to None like in read()
+                    if event == "start_array":
+                        saw_top_concepts = True
+                    continue
+                if prefix == "hasTopConcept.item" and event == "start_map":
+                    concept_builder = ijson.ObjectBuilder()
+                concept_builder.event(event, value)
+                if prefix == "hasTopConcept.item" and event == "end_map":
+                    concepts.append(_CONCEPT_ADAPTER.validate_python(concept_builder.value))
+                    concept_builder = None
+            elif not prefix and event == "map_key" and value == "hasTopConcept":
+                continue  # the concepts are intercepted above
+            else:
+                metadata_builder.event(event, value)
+    metadata = metadata_builder.value
+    metadata.pop("@context", None)
+    kos = KOS.model_validate(metadata)
+    # attach the already-validated concepts without re-validating them. an
+    # explicit empty array stays an empty list, matching what read() returns
+    return kos.model_copy(update={"has_top_concept": concepts if saw_top_concepts else None})
 
 
 def process(kos: KOS, *, converter: Converter | None = None) -> ProcessedKOS:
@@ -914,24 +1170,125 @@ def process(kos: KOS, *, converter: Converter | None = None) -> ProcessedKOS:
     return kos.process(converter)
 
 
-def _process(res_json: dict[str, Any]) -> KOS:
-    res_json.pop("@context", {})
-    # TODO use context to process
-    return KOS.model_validate(res_json)
+def _union_members(annotation: Any) -> tuple[Any, ...]:
+    if get_origin(annotation) in (Union, UnionType):
+        return get_args(annotation)
+    return (annotation,)
+
+
+@functools.lru_cache(maxsize=None)
+def _accepted_keys(cls: type[BaseModel]) -> frozenset[str]:
+    # the input keys a model accepts: field names (populate_by_name) and aliases
+    keys = set()
+    for name, field in cls.model_fields.items():
+        keys.add(name)
+        if field.alias is not None:
+            keys.add(field.alias)
+    return frozenset(keys)
+
+
+@functools.lru_cache(maxsize=None)
+def _union_adapter(annotation: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(annotation)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if isinstance(value, dict):
+        models = [
+            member
+            for member in _union_members(annotation)
+            if isinstance(member, type) and issubclass(member, BaseModel)
+        ]
+        if len(models) == 1:
+            return _construct_model(models[0], value)
+        if models:
+            # several members accept a dict (e.g. an annotation target may be
+            # a Resource or a nested Annotation), so taking one by position
+            # would mis-type the value. pick the member whose declared fields
+            # and aliases cover the dict's keys, and when that is still
+            # ambiguous, let the union's real validator decide
+            covering = [model for model in models if value.keys() <= _accepted_keys(model)]
+            if len(covering) == 1:
+                return _construct_model(covering[0], value)
+            return _union_adapter(annotation).validate_python(value)
+        for member in _union_members(annotation):
+            if get_origin(member) is dict:
+                _, value_annotation = get_args(member)
+                return {k: _construct_value(value_annotation, v) for k, v in value.items()}
+    elif isinstance(value, list):
+        for member in _union_members(annotation):
+            if get_origin(member) is list:
+                (item_annotation,) = get_args(member)
+                return [_construct_value(item_annotation, v) for v in value]
+    return value
+
+
+def _construct_model(cls: type[M], data: dict[str, Any]) -> M:
+    # assemble a model (and, recursively, its children) from a parsed JSKOS
+    # document without running any validation, resolving input aliases like
+    # ``hasTopConcept`` the same way the validator would
+    if not cls.__pydantic_complete__:
+        # forward references (e.g. ``Concept`` in the bundle fields) only get
+        # substituted into the field annotations on rebuild, which defer_build
+        # postpones; without this, such fields would be left as raw dicts
+        cls.model_rebuild(raise_errors=False)
+    kwargs = {}
+    for name, field in cls.model_fields.items():
+        if field.alias is not None and field.alias in data:
+            value = data[field.alias]
+        elif name in data:
+            value = data[name]
+        else:
+            continue
+        kwargs[name] = _construct_value(field.annotation, value)
+    return cls.model_construct(**kwargs)
+
+
+#: A memo of already-processed concepts keyed by object identity, active
+#: during a single :meth:`KOS.process` walk so that a concept reachable
+#: through several edges is processed once. Keying by identity (rather than
+#: URI) keeps distinct objects distinct: documents routinely carry both a
+#: stub and a full representation of the same URI, and neither may clobber
+#: the other. The source objects outlive the walk, so ids cannot be reused
+_concept_memo: ContextVar[dict[int, ProcessedConcept] | None] = ContextVar(
+    "_concept_memo", default=None
+)
+
+
+def _process_concept(concept: Concept, converter: Converter) -> ProcessedConcept:
+    # a module-level function so it can be pickled by ProcessPoolExecutor
+    return concept.process(converter)
 
 
 def _process_jskos_set(s: JSKOSSet | None, converter: curies.Converter) -> ProcessedJSKOSSet | None:
     if s is None:
         return None
-    return [e.process(converter) if e is not None else None for e in s]
+    # the length is known upfront, so preallocate instead of growing by doubling
+    out: ProcessedJSKOSSet = [None] * len(s)
+    for i, e in enumerate(s):
+        if e is not None:
+            out[i] = e.process(converter)
+    return out
+
+
+def _process_many(
+    values: Sequence[SemanticallyProcessable[X]] | None, converter: Converter
+) -> list[X] | None:
+    # a fused None-check and list-build, replacing curies.mixins.process
+    # whose isinstance dispatch and keyword handling cost a frame per field
+    # per node on deeply recursive process() calls
+    if values is None:
+        return None
+    return [value.process(converter) for value in values]
 
 
 def _process_dict(
-    i: dict[AnyUrl, SemanticallyProcessable[X]] | None, converter: Converter
+    i: dict[str, SemanticallyProcessable[X]] | None, converter: Converter
 ) -> dict[Reference, X] | None:
     if i is None:
         return None
-    return {_parse_url(k, converter): v.process(converter) for k, v in i.items()}
+    parse = _parse_url_cached
+    return {parse(k, converter): v.process(converter) for k, v in i.items()}
 
 
 def _safe_process(x: SemanticallyProcessable[X] | None, converter: Converter) -> X | None:
@@ -940,19 +1297,73 @@ def _safe_process(x: SemanticallyProcessable[X] | None, converter: Converter) ->
     return x.process(converter)
 
 
-def _parse_url(url: str | AnyUrl, converter: Converter) -> Reference:
-    return converter.parse_uri(str(url), strict=True).to_pydantic()
+def _parse_url(url: str, converter: Converter) -> Reference:
+    return _parse_url_cached(url, converter)
+
+
+#: A flyweight pool so that all appearances of e.g. ``skos:broader`` in
+#: processed output share a single :class:`curies.Reference` instance
+_REFERENCE_INTERN: dict[tuple[str, str], Reference] = {}
+
+#: Per-converter caches of already-parsed references, weakly keyed so a
+#: converter's cache dies with the converter instead of pinning it forever
+_REFERENCE_CACHES: WeakKeyDictionary[Converter, dict[str, Reference]] = WeakKeyDictionary()
+
+
+def _parse_url_cached(url: str, converter: Converter) -> Reference:
+    # the same URI typically appears many times in a KOS (predicate keys,
+    # broader/narrower back-references), so memoize the prefix lookup
+    cache = _REFERENCE_CACHES.get(converter)
+    if cache is None:
+        cache = _REFERENCE_CACHES[converter] = {}
+    rv = cache.get(url)
+    if rv is not None:
+        return rv
+    reference_tuple = converter.parse_uri(url, strict=True)
+    key = (reference_tuple.prefix, reference_tuple.identifier)
+    rv = _REFERENCE_INTERN.get(key)
+    if rv is None:
+        # both parts were already normalized by the converter, so skip the
+        # re-validation that ReferenceTuple.to_pydantic would run
+        rv = _REFERENCE_INTERN[key] = Reference.model_construct(
+            prefix=reference_tuple.prefix, identifier=reference_tuple.identifier
+        )
+    cache[url] = rv
+    return rv
 
 
 def _parse_optional_urls(
-    urls: Sequence[str | AnyUrl] | None, converter: Converter
+    urls: Sequence[str] | None, converter: Converter
 ) -> list[Reference] | None:
     if urls is None:
         return None
-    return [_parse_url(url, converter) for url in urls]
+    return _parse_urls(urls, converter)
+
 
+def _parse_urls(urls: Sequence[str], converter: Converter) -> list[Reference]:
+    # parse a whole batch at once, hoisting the per-call lookups out of the
+    # loop and preallocating the output since the length is known upfront
+    parse = _parse_url_cached
+    out: list[Reference] = [None] * len(urls)  # type:ignore[list-item]
+    for i, url in enumerate(urls):
+        out[i] = parse(url, converter)
+    return out
 
-def _parse_optional_url(url: str | AnyUrl | None, converter: Converter) -> Reference | None:
+
+def _parse_optional_url(url: str | None, converter: Converter) -> Reference | None:
     if url is None:
         return None
     return _parse_url(url, converter)
+
+
+# build the validators for the entry-point models at import time, which
+# otherwise shows up as a latency spike in the first read() of a fresh
+# interpreter. everything these reference gets built along with them; models
+# outside the read()/process() path stay deferred until first use
+for _cls in (KOS, Concept, ProcessedKOS, ProcessedConcept):
+    _cls.model_rebuild(raise_errors=False)
+
+#: Module-level adapters for the hot validation entry points, so the compiled
+#: validator is bound once instead of being looked up on every call
+_KOS_ADAPTER = TypeAdapter(KOS)
+_CONCEPT_ADAPTER = TypeAdapter(Concept)
@@ -12,6 +12,13 @@ __all__ = [
     "JSKOSClient",
 ]
 
+try:
+    # an optional, much faster drop-in for decoding response payloads,
+    # installable with ``pip install jskos[speedups]``
+    import orjson as _json
+except ImportError:
+    import json as _json  # type:ignore[no-redef]
+
 
 class JSKOSClient:
     """A client to JSKOS API 2.1.
@@ -82,7 +89,8 @@ class JSKOSClient:
         _set(params, "notation", notation)
 
         res = self._get("/voc", params=params)
-        return [self.concept_scheme_cls.model_validate(record) for record in res.json()]
+        records = _json.loads(res.content)
+        return [self.concept_scheme_cls.model_validate(record) for record in records]
 
 
 def _set(d: dict[str, Any], key: str, value: str | list[str] | None, sep: str = "|") -> None:
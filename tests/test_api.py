@@ -1,12 +1,16 @@
 """Test the API."""
 
+import json
+import tempfile
 import unittest
+from importlib.util import find_spec
+from pathlib import Path
 
 import curies
 from curies import Reference
 
 import jskos
-from jskos.api import Concept, Location, Occurrence, Registry, Resource
+from jskos.api import Annotation, Concept, Location, Occurrence, Registry, Resource
 
 converter = curies.Converter.from_prefix_map(
     {
@@ -152,6 +156,116 @@ class TestExamples(unittest.TestCase):
         )
 
 
+class TestRead(unittest.TestCase):
+    """Test reading JSKOS files."""
+
+    def setUp(self) -> None:
+        """Set up a test JSKOS document."""
+        self.record = {
+            "@context": "https://gbv.github.io/jskos/context.json",
+            "id": "https://example.org/kos",
+            "type": "skos:ConceptScheme",
+            "title": {"en": "Test KOS"},
+            "description": {"en": "A test knowledge organization system"},
+            "hasTopConcept": [
+                {
+                    "uri": "http://www.wikidata.org/entity/Q5",
+                    "prefLabel": {"en": "human"},
+                    "narrower": [{"uri": "http://www.wikidata.org/entity/Q406"}],
+                },
+                {"uri": "http://www.wikidata.org/entity/Q2"},
+            ],
+        }
+
+    def test_read(self) -> None:
+        """Test reading a JSKOS file from a path."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.json")
+            path.write_text(json.dumps(self.record))
+            kos = jskos.read(path)
+        self.assertEqual("https://example.org/kos", kos.id)
+        self.assertIsNotNone(kos.has_top_concept)
+        self.assertEqual(2, len(kos.has_top_concept or []))
+
+    def test_read_unvalidated(self) -> None:
+        """Test reading a JSKOS file without validation."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.json")
+            path.write_text(json.dumps(self.record))
+            kos = jskos.read(path, validate=False)
+        self.assertEqual("https://example.org/kos", kos.id)
+        self.assertIsNotNone(kos.has_top_concept)
+        concepts = kos.has_top_concept or []
+        self.assertEqual(2, len(concepts))
+        self.assertIsInstance(concepts[0], Concept)
+        self.assertEqual("http://www.wikidata.org/entity/Q5", concepts[0].uri)
+        self.assertEqual({"en": "human"}, concepts[0].preferred_label)
+
+    def test_read_unvalidated_mapping(self) -> None:
+        """Test that unvalidated reading constructs forward-referenced models."""
+        self.record["hasTopConcept"][0]["mappings"] = [  # type:ignore[index]
+            {
+                "from": {"memberSet": [{"uri": "http://www.wikidata.org/entity/Q5"}]},
+                "to": {"memberSet": [{"uri": "http://www.wikidata.org/entity/Q2"}]},
+            }
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.json")
+            path.write_text(json.dumps(self.record))
+            kos = jskos.read(path, validate=False)
+        mapping = (kos.has_top_concept or [])[0].mappings[0]  # type:ignore[index]
+        self.assertIsInstance(mapping.subject_bundle.member_set[0], Concept)
+        processed_kos = kos.process(converter)
+        self.assertEqual(
+            Reference(prefix="wikidata", identifier="Q5"),
+            processed_kos.concepts[0].mappings[0].from_bundle.member_set[0].reference,
+        )
+
+    def test_read_unvalidated_annotation(self) -> None:
+        """Test that unvalidated reading disambiguates nested annotation targets."""
+        self.record["hasTopConcept"][0]["annotations"] = [  # type:ignore[index]
+            {
+                "id": "http://www.wikidata.org/entity/A1",
+                "type": "Annotation",
+                "target": {
+                    "id": "http://www.wikidata.org/entity/A2",
+                    "type": "Annotation",
+                    "target": {"uri": "http://www.wikidata.org/entity/Q2"},
+                },
+            }
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.json")
+            path.write_text(json.dumps(self.record))
+            kos = jskos.read(path, validate=False)
+        annotation = (kos.has_top_concept or [])[0].annotations[0]  # type:ignore[index]
+        self.assertIsInstance(annotation, Annotation)
+        self.assertIsInstance(annotation.target, Annotation)
+        self.assertIsInstance(annotation.target.target, Resource)
+        processed_kos = kos.process(converter)
+        self.assertEqual(
+            Reference(prefix="wikidata", identifier="A1"),
+            processed_kos.concepts[0].annotations[0].reference,
+        )
+
+    @unittest.skipUnless(find_spec("ijson"), "requires the jskos[streaming] extra")
+    def test_read_streaming(self) -> None:
+        """Test that the streaming reader agrees with the buffering reader."""
+        variants: list[tuple[str, dict[str, object]]] = [
+            ("populated", self.record),
+            ("null", {**self.record, "hasTopConcept": None}),
+            ("empty", {**self.record, "hasTopConcept": []}),
+            ("absent", {k: v for k, v in self.record.items() if k != "hasTopConcept"}),
+        ]
+        for name, record in variants:
+            with self.subTest(variant=name), tempfile.TemporaryDirectory() as directory:
+                path = Path(directory).joinpath("test.json")
+                path.write_text(json.dumps(record))
+                kos = jskos.read(path)
+                kos_streaming = jskos.read_streaming(path)
+                self.assertEqual(kos, kos_streaming)
+
+
 class TestJSKOS(unittest.TestCase):
     """Test the API."""
 